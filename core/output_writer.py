@@ -1,6 +1,7 @@
 """Output writer for standard format."""
 
 import shutil
+from concurrent.futures import Future
 from pathlib import Path
 from typing import List
 from .schemas import TaskPair
@@ -29,8 +30,12 @@ class OutputWriter:
         (task_dir / "prompt.txt").write_text(task_pair.prompt)
         
         # Write video if provided (preserve original extension)
-        if task_pair.ground_truth_video and Path(task_pair.ground_truth_video).exists():
-            video_src = Path(task_pair.ground_truth_video)
+        video = task_pair.ground_truth_video
+        if isinstance(video, Future):
+            video = video.result()  # Wait for background encoding to finish
+        
+        if video and Path(video).exists():
+            video_src = Path(video)
             video_ext = video_src.suffix  # .mp4 or .avi
             shutil.copy(video_src, task_dir / f"ground_truth{video_ext}")
         
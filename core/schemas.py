@@ -11,7 +11,7 @@ class TaskPair(BaseModel):
     prompt: str
     first_image: Any  # PIL Image
     final_image: Optional[Any] = None  # PIL Image
-    ground_truth_video: Optional[str] = None  # Path to video (optional)
+    ground_truth_video: Optional[Any] = None  # Path to video, or a Future resolving to one (optional)
     
     class Config:
         arbitrary_types_allowed = True
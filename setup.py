@@ -21,6 +21,10 @@ setup(
     packages=find_packages(include=["core", "core.*", "src", "src.*"]),
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        # JIT-compiles the solver kernel (falls back to plain Python if missing)
+        "numba": ["numba==0.60.0"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -0,0 +1,205 @@
+"""
+Sudoku solver kernel.
+
+Operates on a flat 81-cell int8 grid plus int32 row/column/box digit
+bitmasks (bit n set => digit n used). Compiled with numba when it is
+installed; the kernels are compiled (or loaded from numba's on-disk cache)
+when this module is imported, so worker processes forked afterwards start
+with them ready and only the very first run pays the JIT cost.
+"""
+
+import importlib.util
+
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit: run the kernel as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Box index (0-8, row-major) of each (row, col) cell
+BOX_OF = np.array(
+    [[(r // 3) * 3 + c // 3 for c in range(9)] for r in range(9)],
+    dtype=np.int8
+)
+
+
+@njit(cache=True)
+def _popcount(x):
+    """Number of set bits in x."""
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def _select_cell(row_mask, col_mask, box_mask, empties, n_empty, idx):
+    """
+    Swap the most constrained of empties[idx:n_empty] (MRV) into position
+    idx and return its number of candidates (0 means a dead end).
+
+    The scan only stops early on a zero-candidate cell, so a dead end
+    anywhere among the remaining cells is always detected.
+    """
+    best = idx
+    best_count = 10
+    for k in range(idx, n_empty):
+        cell = empties[k]
+        r = cell // 9
+        c = cell % 9
+        used = row_mask[r] | col_mask[c] | box_mask[BOX_OF[r, c]]
+        count = _popcount(0x3FE & ~used)
+        if count < best_count:
+            best = k
+            best_count = count
+            if count == 0:
+                break  # Dead end - no need to look further
+
+    cell = empties[best]
+    empties[best] = empties[idx]
+    empties[idx] = cell
+    return best_count
+
+
+@njit(cache=True)
+def _search(grid, row_mask, col_mask, box_mask, empties, n_empty, limit):
+    """
+    Iterative backtracking over the empty cells, stopping after limit solutions.
+
+    Depth k fills empties[k]; tried[k] records the digits already tried
+    there, so backtracking is a matter of undoing the placement at k and
+    moving on to the next untried candidate. Cells are picked by MRV as
+    depths are entered.
+
+    Returns:
+        Number of solutions found (at most limit). When limit is reached
+        the last solution is left in grid and the masks; otherwise grid
+        and masks are back to their initial state.
+    """
+    if n_empty == 0:
+        return 1
+    if _select_cell(row_mask, col_mask, box_mask, empties, n_empty, 0) == 0:
+        return 0
+
+    tried = np.zeros(n_empty, dtype=np.int32)
+    found = 0
+    k = 0
+    while True:
+        cell = empties[k]
+        row = cell // 9
+        col = cell % 9
+        box = BOX_OF[row, col]
+
+        # Undo the digit currently placed at this depth, if any
+        num = int(grid[cell])
+        if num:
+            bit = 1 << num
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[box] ^= bit
+            grid[cell] = 0
+
+        cand = 0x3FE & ~(row_mask[row] | col_mask[col] | box_mask[box] | tried[k])
+        if cand == 0:
+            # Exhausted this cell: backtrack
+            if k == 0:
+                return found
+            k -= 1
+            continue
+
+        # Place the lowest untried candidate
+        bit = cand & -cand
+        num = 1
+        while (bit >> num) != 1:
+            num += 1
+        tried[k] |= bit
+        grid[cell] = num
+        row_mask[row] |= bit
+        col_mask[col] |= bit
+        box_mask[box] |= bit
+
+        if k + 1 == n_empty:
+            found += 1
+            if found >= limit:
+                return found
+            continue  # Keep searching from the last cell
+
+        # Enter the next depth; fail first if some cell has no candidates
+        if _select_cell(row_mask, col_mask, box_mask, empties, n_empty, k + 1) == 0:
+            continue
+        k += 1
+        tried[k] = 0
+
+
+@njit(cache=True)
+def solve(grid, row_mask, col_mask, box_mask, empties, n_empty):
+    """
+    Fill the empty cells of grid in place using backtracking.
+
+    Candidates are tried in fixed ascending order, so the search loop
+    allocates nothing; callers get variety by seeding grid randomly.
+
+    Args:
+        grid: Flat int8 array of 81 cells (0 for empty)
+        row_mask, col_mask, box_mask: int32 arrays of 9 digit bitmasks
+        empties: Flat indices of the empty cells (reordered during search)
+        n_empty: Number of valid entries in empties
+
+    Returns:
+        True if the grid was completed
+    """
+    return _search(grid, row_mask, col_mask, box_mask, empties, n_empty, 1) == 1
+
+
+@njit(cache=True)
+def count_solutions(grid, row_mask, col_mask, box_mask, empties, n_empty, limit):
+    """
+    Count the completions of grid, stopping as soon as limit is reached.
+
+    Takes the same arguments as solve(). grid and the masks are restored
+    before returning; only the order of empties[:n_empty] changes.
+
+    Returns:
+        Number of solutions found, at most limit
+    """
+    found = _search(grid, row_mask, col_mask, box_mask, empties, n_empty, limit)
+
+    # Reaching the limit leaves a solution filled in: clear it again
+    if found >= limit:
+        for k in range(n_empty):
+            cell = empties[k]
+            num = int(grid[cell])
+            if num:
+                bit = 1 << num
+                row = cell // 9
+                col = cell % 9
+                row_mask[row] ^= bit
+                col_mask[col] ^= bit
+                box_mask[BOX_OF[row, col]] ^= bit
+                grid[cell] = 0
+
+    return found
+
+
+def _warm_up():
+    """Compile the kernels for the argument types the generator passes."""
+    grid = np.zeros(81, dtype=np.int8)
+    row_mask = np.zeros(9, dtype=np.int32)
+    col_mask = np.zeros(9, dtype=np.int32)
+    box_mask = np.zeros(9, dtype=np.int32)
+    empties = np.arange(81, dtype=np.int32)
+    solve(grid, row_mask, col_mask, box_mask, empties, len(empties))
+    count_solutions(grid, row_mask, col_mask, box_mask, empties[:0], 0, 2)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
@@ -7,6 +7,7 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+from typing import Optional
 from pydantic import Field
 from core import GenerationConfig
 
@@ -33,6 +34,12 @@ class TaskConfig(GenerationConfig):
     domain: str = Field(default="sudoku")
     image_size: tuple[int, int] = Field(default=(512, 512))
     
+    num_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker processes for generate_dataset (None = all CPU cores, 1 = no pool)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
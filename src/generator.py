@@ -7,16 +7,42 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import os
 import random
 import tempfile
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterable, Iterator, Optional, List, Tuple, Union
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from core import BaseGenerator, TaskPair, ImageRenderer
 from core.video_utils import VideoGenerator
 from .config import TaskConfig
 from .prompts import get_prompt
+from ._solver import BOX_OF, count_solutions, solve
+
+
+# TrueType fonts tried in order for digits; PIL's default font is the fallback
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "Arial.ttf",
+)
+
+# Generator owned by each worker process of the dataset pool
+_worker_generator: Optional["TaskGenerator"] = None
+
+
+def _init_worker(config: TaskConfig) -> None:
+    """Build the per-process generator once when a pool worker starts."""
+    global _worker_generator
+    _worker_generator = TaskGenerator(config)
+
+
+def _generate_in_worker(task_id: str) -> TaskPair:
+    """Generate one task pair inside a pool worker (videos encode inline)."""
+    return _worker_generator._generate_seeded_task_pair(task_id)
 
 
 class TaskGenerator(BaseGenerator):
@@ -28,12 +54,100 @@ class TaskGenerator(BaseGenerator):
     
     def __init__(self, config: TaskConfig):
         super().__init__(config)
+        
+        # Generator-owned RNG for all task randomness (reseeded per task)
+        self.rng = random.Random(config.random_seed)
+        
         self.renderer = ImageRenderer(image_size=config.image_size)
         
+        # Grid geometry and font are fixed per config - compute them once
+        width, height = config.image_size
+        self.cell_size = min(width, height) // 10  # Leave some margin
+        self.start_x = (width - self.cell_size * 9) // 2
+        self.start_y = (height - self.cell_size * 9) // 2
+        self.font = self._load_font(int(self.cell_size * 0.5))
+        self._grid_template = self._build_grid_template()
+        
+        # Offset from a cell's top-left corner that centers each digit in it
+        measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        half_cell = self.cell_size // 2
+        self._digit_offsets = {}
+        overhang = 0
+        for d in range(1, 10):
+            bbox = measure.textbbox((0, 0), str(d), font=self.font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+            dx = half_cell - text_width // 2
+            dy = half_cell - text_height // 2
+            self._digit_offsets[str(d)] = (dx, dy)
+            
+            # How far the glyph spills out of its cell (large at small sizes)
+            overhang = max(
+                overhang,
+                -(dx + bbox[0]), dx + bbox[2] - self.cell_size,
+                -(dy + bbox[1]), dy + bbox[3] - self.cell_size
+            )
+        
+        # Cells away whose digits can touch a highlight box (which also
+        # covers the first pixel row/column of the next cell)
+        self._digit_reach = 1 + -(-max(overhang, 0) // self.cell_size)
+        
         # Initialize video generator if enabled
         self.video_generator = None
         if config.generate_videos and VideoGenerator.is_available():
             self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+        
+        # Background video encoder, only set while generate_dataset runs
+        # tasks in this process (pool workers encode inline instead)
+        self._video_pool = None
+    
+    def generate_dataset(self) -> List[TaskPair]:
+        """
+        Generate complete dataset, spreading tasks across worker processes.
+        
+        Each task reseeds the RNG from (random_seed, task_id), so a seeded
+        run produces the same dataset regardless of the number of workers.
+        With a single worker, videos are encoded on a background thread pool
+        while the next task is generated.
+        """
+        task_ids = [f"{self.config.domain}_{i:04d}" for i in range(self.config.num_samples)]
+        num_workers = min(self.config.num_workers or os.cpu_count() or 1, len(task_ids))
+        
+        if num_workers <= 1:
+            if self.video_generator:
+                self._video_pool = ThreadPoolExecutor(max_workers=2)
+            try:
+                return self._collect_pairs(map(self._generate_seeded_task_pair, task_ids))
+            finally:
+                if self._video_pool:
+                    # Queued videos still encode; the threads exit once they're done
+                    self._video_pool.shutdown(wait=False)
+                    self._video_pool = None
+        
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self.config,)
+        ) as executor:
+            return self._collect_pairs(executor.map(_generate_in_worker, task_ids))
+    
+    def _collect_pairs(self, results: Iterable[TaskPair]) -> List[TaskPair]:
+        """Gather task pairs in submission order, reporting progress."""
+        pairs = []
+        for pair in results:
+            pairs.append(pair)
+            print(f"  Generated: {pair.task_id}")
+        return pairs
+    
+    def _generate_seeded_task_pair(self, task_id: str) -> TaskPair:
+        """Seed the RNG for this task, then generate it."""
+        if self.config.random_seed is None:
+            seed = None  # Fresh OS entropy, so forked workers don't repeat each other
+        else:
+            seed = zlib.crc32(f"{self.config.random_seed}:{task_id}".encode())
+        self.rng.seed(seed)
+        
+        return self.generate_task_pair(task_id)
     
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one sudoku task pair."""
@@ -45,14 +159,14 @@ class TaskGenerator(BaseGenerator):
         first_image = self._render_sudoku(puzzle)
         final_image = self._render_sudoku(solution)
         
-        # Generate video (optional)
-        video_path = None
+        # Generate video (optional) - may be encoded in the background
+        video = None
         if self.config.generate_videos and self.video_generator:
-            video_path = self._generate_video(puzzle, solution, task_id)
+            video = self._generate_video(puzzle, solution, task_id)
         
         # Select prompt
         difficulty = self._assess_difficulty(puzzle)
-        prompt = get_prompt(difficulty)
+        prompt = get_prompt(difficulty, self.rng)
         
         return TaskPair(
             task_id=task_id,
@@ -60,126 +174,144 @@ class TaskGenerator(BaseGenerator):
             prompt=prompt,
             first_image=first_image,
             final_image=final_image,
-            ground_truth_video=video_path
+            ground_truth_video=video
         )
     
     # ══════════════════════════════════════════════════════════════════════════
     #  SUDOKU GENERATION
     # ══════════════════════════════════════════════════════════════════════════
     
-    def _generate_sudoku(self) -> Tuple[List[List[int]], List[List[int]]]:
+    def _generate_sudoku(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generate a valid sudoku puzzle and its solution.
         
         Returns:
-            (puzzle, solution) where puzzle has 0s for empty cells
+            (puzzle, solution) as 9x9 int8 arrays where puzzle has 0s for empty cells
         """
         # First, generate a complete valid solution
         solution = self._generate_complete_sudoku()
         
         # Then, remove numbers to create a puzzle
-        puzzle = [row[:] for row in solution]  # Deep copy
-        puzzle = self._create_puzzle(puzzle, solution)
+        puzzle = self._create_puzzle(solution)
         
         return puzzle, solution
     
-    def _generate_complete_sudoku(self) -> List[List[int]]:
-        """Generate a complete valid sudoku solution."""
-        grid = [[0] * 9 for _ in range(9)]
+    def _generate_complete_sudoku(self) -> np.ndarray:
+        """Generate a complete valid sudoku solution as a 9x9 int8 array."""
+        grid = np.zeros(81, dtype=np.int8)
+        
+        # Bitmasks of digits used per row/column/box (bit n set => digit n used)
+        row_mask = np.zeros(9, dtype=np.int32)
+        col_mask = np.zeros(9, dtype=np.int32)
+        box_mask = np.zeros(9, dtype=np.int32)
         
         # Fill diagonal 3x3 boxes first (they don't conflict)
         for box in range(0, 9, 3):
-            self._fill_box(grid, box, box)
+            self._fill_box(grid, box, box, row_mask, col_mask, box_mask)
         
-        # Solve the rest using backtracking
-        self._solve_sudoku(grid)
+        # Solve the rest using the backtracking kernel
+        empties = np.flatnonzero(grid == 0).astype(np.int32)
+        solve(grid, row_mask, col_mask, box_mask, empties, len(empties))
         
-        return grid
+        return grid.reshape(9, 9)
     
-    def _fill_box(self, grid: List[List[int]], row: int, col: int) -> None:
-        """Fill a 3x3 box with random numbers 1-9."""
+    def _fill_box(
+        self,
+        grid: np.ndarray,
+        row: int,
+        col: int,
+        row_mask: np.ndarray,
+        col_mask: np.ndarray,
+        box_mask: np.ndarray
+    ) -> None:
+        """
+        Fill a 3x3 box of the flat grid with a random permutation of 1-9.
+        
+        This is the only randomness in the complete solution - the solver
+        tries candidates in fixed order, and the three shuffled diagonal
+        boxes alone give ~10^16 distinct seedings.
+        """
         numbers = list(range(1, 10))
-        random.shuffle(numbers)
+        self.rng.shuffle(numbers)
+        bits = [1 << num for num in numbers]
         
-        idx = 0
-        for i in range(3):
-            for j in range(3):
-                grid[row + i][col + j] = numbers[idx]
-                idx += 1
-    
-    def _solve_sudoku(self, grid: List[List[int]]) -> bool:
-        """Solve sudoku using backtracking. Returns True if solvable."""
-        for i in range(9):
-            for j in range(9):
-                if grid[i][j] == 0:
-                    numbers = list(range(1, 10))
-                    random.shuffle(numbers)  # Randomize for variety
-                    
-                    for num in numbers:
-                        if self._is_valid(grid, i, j, num):
-                            grid[i][j] = num
-                            if self._solve_sudoku(grid):
-                                return True
-                            grid[i][j] = 0
-                    return False
-        return True
-    
-    def _is_valid(self, grid: List[List[int]], row: int, col: int, num: int) -> bool:
-        """Check if placing num at (row, col) is valid."""
-        # Check row
-        for j in range(9):
-            if grid[row][j] == num:
-                return False
-        
-        # Check column
-        for i in range(9):
-            if grid[i][col] == num:
-                return False
-        
-        # Check 3x3 box
-        box_row = (row // 3) * 3
-        box_col = (col // 3) * 3
+        grid.reshape(9, 9)[row:row + 3, col:col + 3] = np.reshape(numbers, (3, 3))
         for i in range(3):
-            for j in range(3):
-                if grid[box_row + i][box_col + j] == num:
-                    return False
-        
-        return True
+            row_mask[row + i] |= bits[3 * i] | bits[3 * i + 1] | bits[3 * i + 2]
+            col_mask[col + i] |= bits[i] | bits[i + 3] | bits[i + 6]
+        box_mask[BOX_OF[row, col]] = 0x3FE
     
-    def _create_puzzle(self, puzzle: List[List[int]], solution: List[List[int]]) -> List[List[int]]:
-        """Remove numbers from solution to create a puzzle."""
+    def _create_puzzle(self, solution: np.ndarray) -> np.ndarray:
+        """Remove numbers from a copy of solution to create a puzzle with a unique solution."""
         # Determine number of cells to remove based on difficulty
-        min_givens = self.config.min_givens
-        max_givens = self.config.max_givens
-        target_givens = random.randint(min_givens, max_givens)
-        
-        # Create list of all positions
-        positions = [(i, j) for i in range(9) for j in range(9)]
-        random.shuffle(positions)
-        
-        # Remove numbers while ensuring puzzle remains solvable
+        target_removed = 81 - self.rng.randint(self.config.min_givens, self.config.max_givens)
+        
+        # Solver state for the puzzle: a full grid uses every digit everywhere
+        puzzle = solution.copy()
+        grid = puzzle.ravel()  # Flat view - kernel writes go to puzzle
+        row_mask = np.full(9, 0x3FE, dtype=np.int32)
+        col_mask = np.full(9, 0x3FE, dtype=np.int32)
+        box_mask = np.full(9, 0x3FE, dtype=np.int32)
+        
+        # Remove cells in point-symmetric pairs (pos, 80 - pos), so the pairs
+        # cover an even count; an odd target also takes the center (pos 40),
+        # chosen up front since a single hole always keeps the solution unique
         removed = 0
-        total_cells = 81
-        target_removed = total_cells - target_givens
-        
-        for row, col in positions:
+        solved = solution.ravel()
+        if target_removed % 2:
+            self._toggle_cells(grid, solved, (40,), row_mask, col_mask, box_mask)
+            removed = 1
+        
+        # One uniqueness check per pair. Removals can be rejected, so every
+        # pair may be needed; if the pairs run out first the puzzle keeps a
+        # few more givens than targeted rather than losing its symmetry
+        for pos in self.rng.sample(range(40), 40):
             if removed >= target_removed:
                 break
-            
-            # Try removing this cell
-            original = puzzle[row][col]
-            puzzle[row][col] = 0
-            
-            # Check if puzzle still has unique solution
-            # For simplicity, we'll use a heuristic: remove if it doesn't break uniqueness
-            # In a production system, you'd want more sophisticated checking
-            removed += 1
+            if self._try_remove(grid, solved, (pos, 80 - pos), row_mask, col_mask, box_mask):
+                removed += 2
         
         return puzzle
     
-    def _assess_difficulty(self, puzzle: List[List[int]]) -> str:
+    def _toggle_cells(
+        self,
+        grid: np.ndarray,
+        solved: np.ndarray,
+        cells: Tuple[int, ...],
+        row_mask: np.ndarray,
+        col_mask: np.ndarray,
+        box_mask: np.ndarray
+    ) -> None:
+        """Flip flat cells between empty and their solution digit, updating the masks."""
+        for cell in cells:
+            row, col = divmod(cell, 9)
+            digit = int(solved[cell])
+            grid[cell] = digit - grid[cell]
+            bit = 1 << digit
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[BOX_OF[row, col]] ^= bit
+    
+    def _try_remove(
+        self,
+        grid: np.ndarray,
+        solved: np.ndarray,
+        cells: Tuple[int, ...],
+        row_mask: np.ndarray,
+        col_mask: np.ndarray,
+        box_mask: np.ndarray
+    ) -> bool:
+        """Empty flat cells, keeping the removal only if the solution stays unique."""
+        self._toggle_cells(grid, solved, cells, row_mask, col_mask, box_mask)
+        empties = np.flatnonzero(grid == 0).astype(np.int32)
+        if count_solutions(grid, row_mask, col_mask, box_mask, empties, len(empties), 2) == 1:
+            return True
+        self._toggle_cells(grid, solved, cells, row_mask, col_mask, box_mask)
+        return False
+    
+    def _assess_difficulty(self, puzzle: np.ndarray) -> str:
         """Assess puzzle difficulty based on number of givens."""
-        givens = sum(1 for row in puzzle for cell in row if cell != 0)
+        givens = int(np.count_nonzero(puzzle))
         
         if givens >= 30:
             return "easy"
@@ -192,99 +324,158 @@ class TaskGenerator(BaseGenerator):
     #  RENDERING
     # ══════════════════════════════════════════════════════════════════════════
     
-    def _render_sudoku(self, grid: List[List[int]], highlight_cells: Optional[List[Tuple[int, int]]] = None) -> Image.Image:
-        """
-        Render sudoku grid as image.
-        
-        Args:
-            grid: 9x9 grid with numbers (0 for empty)
-            highlight_cells: Optional list of (row, col) tuples to highlight
-        """
-        img = Image.new("RGB", self.config.image_size, color="white")
-        draw = ImageDraw.Draw(img)
-        
-        width, height = self.config.image_size
-        cell_size = min(width, height) // 10  # Leave some margin
-        start_x = (width - cell_size * 9) // 2
-        start_y = (height - cell_size * 9) // 2
-        
-        # Load font
-        font_size = int(cell_size * 0.5)
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", font_size)
-        except:
+    def _load_font(self, font_size: int) -> ImageFont.ImageFont:
+        """Load the first available font in FONT_CANDIDATES, else PIL's default font."""
+        for path in FONT_CANDIDATES:
             try:
-                font = ImageFont.truetype("Arial.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+                return ImageFont.truetype(path, font_size)
+            except OSError:
+                continue
+        return ImageFont.load_default()
+    
+    def _build_grid_template(self) -> Image.Image:
+        """Draw the empty grid (background + lines) once with NumPy slicing."""
+        width, height = self.config.image_size
+        bg = np.full((height, width, 3), 255, dtype=np.uint8)
+        
+        cell_size = self.cell_size
+        start_x = self.start_x
+        start_y = self.start_y
+        end_x = start_x + cell_size * 9
+        end_y = start_y + cell_size * 9
         
-        # Draw grid
         for i in range(10):
+            # Same pixels as ImageDraw.line: wide lines straddle the coordinate
+            line_width = 3 if i % 3 == 0 else 1
+            lo = (line_width - 1) // 2
+            hi = line_width // 2 + 1
+            
             # Vertical lines
             x = start_x + i * cell_size
-            line_width = 3 if i % 3 == 0 else 1
-            draw.line([(x, start_y), (x, start_y + cell_size * 9)], 
-                     fill=(0, 0, 0), width=line_width)
+            bg[start_y:end_y + 1, max(x - lo, 0):x + hi] = 0
             
             # Horizontal lines
             y = start_y + i * cell_size
-            draw.line([(start_x, y), (start_x + cell_size * 9, y)], 
-                     fill=(0, 0, 0), width=line_width)
+            bg[max(y - lo, 0):y + hi, start_x:end_x + 1] = 0
+        
+        return Image.fromarray(bg)
+    
+    def _render_sudoku(self, grid: np.ndarray, highlight_cells: Optional[List[Tuple[int, int]]] = None) -> Image.Image:
+        """
+        Render sudoku grid as image.
+        
+        Args:
+            grid: 9x9 int8 array with numbers (0 for empty)
+            highlight_cells: Optional list of (row, col) tuples to highlight
+        """
+        img = self._render_base_grid(grid)
         
         # Highlight cells if specified
         if highlight_cells:
             for row, col in highlight_cells:
-                x0 = start_x + col * cell_size
-                y0 = start_y + row * cell_size
-                x1 = x0 + cell_size
-                y1 = y0 + cell_size
-                draw.rectangle([x0, y0, x1, y1], fill=(255, 255, 200), outline=(255, 200, 0), width=2)
+                self._stamp_highlight(img, grid, row, col)
+        
+        return img
+    
+    def _render_base_grid(self, grid: np.ndarray) -> Image.Image:
+        """Render grid lines and all non-empty cells, without highlights."""
+        img = self._grid_template.copy()
+        draw = ImageDraw.Draw(img)
         
         # Draw numbers
-        for i in range(9):
-            for j in range(9):
-                if grid[i][j] != 0:
-                    x = start_x + j * cell_size + cell_size // 2
-                    y = start_y + i * cell_size + cell_size // 2
-                    
-                    # Center text
-                    text = str(grid[i][j])
-                    bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    
-                    draw.text(
-                        (x - text_width // 2, y - text_height // 2),
-                        text,
-                        fill=(0, 0, 0),
-                        font=font
-                    )
+        for i, j in zip(*np.nonzero(grid)):
+            self._draw_digit(draw, int(i), int(j), grid[i, j])
         
         return img
     
+    def _stamp_cell(self, img: Image.Image, row: int, col: int, digit: int) -> None:
+        """Draw a single cell's digit onto img in place."""
+        if digit != 0:
+            self._draw_digit(ImageDraw.Draw(img), row, col, digit)
+    
+    def _stamp_highlight(self, img: Image.Image, grid: np.ndarray, row: int, col: int) -> None:
+        """
+        Highlight cell (row, col) of img in place.
+        
+        The highlight is built as a patch - grid lines, highlight box, then
+        the digits of every cell that can reach it (at small sizes digits
+        spill into neighbouring cells) - and pasted over img, so the result
+        matches rendering the whole grid with the highlight drawn first.
+        """
+        x0 = self.start_x + col * self.cell_size
+        y0 = self.start_y + row * self.cell_size
+        x1 = x0 + self.cell_size
+        y1 = y0 + self.cell_size
+        
+        patch = self._grid_template.crop((x0, y0, x1 + 1, y1 + 1))
+        draw = ImageDraw.Draw(patch)
+        draw.rectangle([0, 0, x1 - x0, y1 - y0], fill=(255, 255, 200), outline=(255, 200, 0), width=2)
+        
+        reach = self._digit_reach
+        for i in range(max(row - reach, 0), min(row + reach + 1, 9)):
+            for j in range(max(col - reach, 0), min(col + reach + 1, 9)):
+                if grid[i, j] != 0:
+                    self._draw_digit(draw, i, j, grid[i, j], origin=(x0, y0))
+        
+        img.paste(patch, (x0, y0))
+    
+    def _draw_digit(
+        self,
+        draw: ImageDraw.ImageDraw,
+        row: int,
+        col: int,
+        digit: int,
+        origin: Tuple[int, int] = (0, 0)
+    ) -> None:
+        """Draw a digit centered in cell (row, col), on an image whose top-left is at origin."""
+        text = str(digit)
+        dx, dy = self._digit_offsets[text]
+        
+        draw.text(
+            (
+                self.start_x + col * self.cell_size + dx - origin[0],
+                self.start_y + row * self.cell_size + dy - origin[1]
+            ),
+            text,
+            fill=(0, 0, 0),
+            font=self.font
+        )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  VIDEO GENERATION
     # ══════════════════════════════════════════════════════════════════════════
     
     def _generate_video(
         self,
-        puzzle: List[List[int]],
-        solution: List[List[int]],
+        puzzle: np.ndarray,
+        solution: np.ndarray,
         task_id: str
-    ) -> Optional[str]:
-        """Generate ground truth video showing solving process."""
+    ) -> Union["Future[Optional[str]]", Optional[str]]:
+        """
+        Generate the ground truth video showing the solving process.
+        
+        When the background video pool is running, rendering and encoding
+        overlap with the next task's generation and a future resolving to
+        the video path is returned (OutputWriter waits for it); otherwise
+        the video is encoded right away and its path returned.
+        """
         temp_dir = Path(tempfile.gettempdir()) / f"{self.config.domain}_videos"
         temp_dir.mkdir(parents=True, exist_ok=True)
         video_path = temp_dir / f"{task_id}_ground_truth.mp4"
         
-        # Create animation frames showing solving process
-        frames = self._create_solving_frames(puzzle, solution)
-        
-        if not frames:
-            return None
+        # Built here, not in the pool, so the fill order is drawn from the
+        # RNG before the next task reseeds it
+        timed_frames = self._create_solving_frames(puzzle, solution)
         
-        result = self.video_generator.create_video_from_frames(
-            frames,
+        if self._video_pool is None:
+            return self._encode_video(timed_frames, video_path)
+        return self._video_pool.submit(self._encode_video, timed_frames, video_path)
+    
+    def _encode_video(self, timed_frames: Iterable[Tuple[Image.Image, int]], video_path: Path) -> Optional[str]:
+        """Encode frames to video_path, on the background video pool if it is running."""
+        # Frames are streamed straight into the encoder, one per distinct image
+        result = self.video_generator.create_video_from_timed_frames(
+            timed_frames,
             video_path
         )
         
@@ -292,25 +483,23 @@ class TaskGenerator(BaseGenerator):
     
     def _create_solving_frames(
         self,
-        puzzle: List[List[int]],
-        solution: List[List[int]],
+        puzzle: np.ndarray,
+        solution: np.ndarray,
         hold_frames: int = 4,
         step_frames: Optional[int] = None
-    ) -> List[Image.Image]:
+    ) -> Iterator[Tuple[Image.Image, int]]:
         """
-        Create animation frames showing the solving process.
+        Create (frame, repeat) pairs showing the solving process.
         
-        Shows numbers being filled in step by step.
+        Shows numbers being filled in step by step. Each distinct image is
+        yielded once with the number of video frames it is held for.
         Dynamically adjusts frame count to match target video duration.
+        The fill order is chosen immediately; frames are rendered lazily,
+        so only the current frame and the running canvas are alive at any
+        time.
         """
-        frames = []
-        
         # Get list of cells to fill (empty cells in puzzle)
-        cells_to_fill = []
-        for i in range(9):
-            for j in range(9):
-                if puzzle[i][j] == 0:
-                    cells_to_fill.append((i, j))
+        cells_to_fill = np.argwhere(puzzle == 0).tolist()
         
         num_cells = len(cells_to_fill)
         
@@ -331,31 +520,42 @@ class TaskGenerator(BaseGenerator):
             else:
                 step_frames = 1
         
-        # Hold initial puzzle
-        initial_frame = self._render_sudoku(puzzle)
-        for _ in range(hold_frames):
-            frames.append(initial_frame)
-        
         # Randomize order for visual variety
-        random.shuffle(cells_to_fill)
+        self.rng.shuffle(cells_to_fill)
         
-        # Create intermediate states
-        current_state = [row[:] for row in puzzle]  # Deep copy
+        return self._render_solving_frames(puzzle, solution, cells_to_fill, hold_frames, step_frames)
+    
+    def _render_solving_frames(
+        self,
+        puzzle: np.ndarray,
+        solution: np.ndarray,
+        cells_to_fill: List[List[int]],
+        hold_frames: int,
+        step_frames: int
+    ) -> Iterator[Tuple[Image.Image, int]]:
+        """Yield the (frame, repeat) pairs for filling cells_to_fill in order."""
+        # Hold initial puzzle
+        # The canvas accumulates filled digits; each step only stamps one cell
+        canvas = self._render_base_grid(puzzle)
+        initial_frame = canvas.copy()
+        yield initial_frame, hold_frames
         
+        # Create intermediate states
+        current_state = puzzle.copy()
         for row, col in cells_to_fill:
-            # Fill this cell
-            current_state[row][col] = solution[row][col]
+            digit = solution[row, col]
+            current_state[row, col] = digit
+            
+            # Fill this cell (first, so any spill outside its box is kept)
+            self._stamp_cell(canvas, row, col, digit)
             
             # Render frame with this cell highlighted
-            frame = self._render_sudoku(current_state, highlight_cells=[(row, col)])
+            frame = canvas.copy()
+            self._stamp_highlight(frame, current_state, row, col)
             
-            # Add frames for this step
-            for _ in range(step_frames):
-                frames.append(frame)
-        
-        # Hold final solution
-        final_frame = self._render_sudoku(solution)
-        for _ in range(hold_frames):
-            frames.append(final_frame)
+            # Hold this step for step_frames frames
+            yield frame, step_frames
         
-        return frames
+        # Hold final solution (canvas now has every cell filled)
+        final_frame = canvas
+        yield final_frame, hold_frames